@@ -8,6 +8,15 @@ import os
 
 from setuptools import setup
 
+# Compiling tornado_ari.model with Cython is opt-in, so that a missing C
+# compiler never breaks a regular install.
+if os.environ.get("TORNADO_ARI_CYTHON"):
+    from Cython.Build import cythonize
+    ext_modules = cythonize(["tornado_ari/model.py"],
+                            compiler_directives={"language_level": "3str"})
+else:
+    ext_modules = []
+
 setup(
     name="tornado-ari",
     version="0.2.0",
@@ -19,6 +28,7 @@ setup(
     author_email="pulsar314@gmail.com",
     url="https://github.com/pulsar314/tornado-ari",
     packages=["tornado_ari"],
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 1 - Planning",
         "Intended Audience :: Developers",
@@ -27,5 +37,6 @@ setup(
         "Operating System :: OS Independent",
         "Programming Language :: Python",
     ],
-    install_requires=["tornado-swagger", "tornado"],
+    install_requires=["tornado-swagger", "tornado>=5.1"],
+    extras_require={"speedups": ["orjson"]},
 )
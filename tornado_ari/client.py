@@ -5,17 +5,31 @@
 """ARI client library.
 """
 
-import json
-import urlparse
-from collections import defaultdict
+from itertools import islice
 from tornado.ioloop import IOLoop
 from tornado.gen import coroutine
-from tornado.concurrent import TracebackFuture
+from tornado.concurrent import Future
 from tornado.log import app_log as log
 import tornado_swagger.client
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from .model import Repository, CLASS_MAP
 
+#: Maximum number of buffered WebSocket messages dispatched in one batch.
+EVENT_BATCH_SIZE = 64
+
+#: Location of the Swagger resource listing, relative to the base URL.
+DOCS_PATH = 'ari/api-docs/resources.json'
+
+#: Swagger types which never hold first class objects.
+_PRIMITIVE_TYPES = frozenset([
+    'boolean', 'byte', 'date', 'date-time', 'double', 'float', 'int',
+    'integer', 'long', 'number', 'object', 'string', 'void'])
+
 
 class Client(object):
     """ARI Client object.
@@ -25,7 +39,7 @@ class Client(object):
     """
 
     def __init__(self, base_url, io_loop=None, http_client=None):
-        url = urlparse.urljoin(base_url, 'ari/api-docs/resources.json')
+        url = base_url.rstrip('/') + '/' + DOCS_PATH
         if io_loop is None:
             io_loop = IOLoop.current()
         self.io_loop = io_loop
@@ -49,8 +63,18 @@ class Client(object):
         else:
             self.event_models = dict()
 
+        # List the fields which may hold first class objects, with their
+        # type names, once per event type. Factories are still looked up in
+        # CLASS_MAP for every event, as it may be changed at runtime.
+        self._event_dispatch = {
+            name: tuple((field, prop['type'])
+                        for field, prop in model['properties'].items()
+                        if prop['type'] not in _PRIMITIVE_TYPES and
+                        '[' not in prop['type'])
+            for name, model in self.event_models.items()}
+
         self.websockets = set()
-        self.event_listeners = defaultdict(list)
+        self.event_listeners = {name: [] for name in self.event_models}
 
     def __getattr__(self, item):
         """Exposes repositories as fields of the client.
@@ -82,56 +106,104 @@ class Client(object):
         """
         return self.repositories.get(name)
 
+    def __process_event(self, event_type, msg_json):
+        """Sends a parsed message to the client's listeners.
+
+        :param event_type: Type of the event.
+        :param msg_json: Event data received from the WebSocket.
+        :type  msg_json: dict
+        """
+        log.debug('Process ARI event: %s', msg_json)
+        listeners = self.event_listeners.get(event_type)
+        if not listeners:
+            return
+        # Drop cancelled listeners before paying for object extraction
+        listeners[:] = [listener for listener in listeners
+                        if not listener[0].done()]
+        if not listeners:
+            return
+
+        log.debug('Listeners of event type "%s": %d',
+                  event_type, len(listeners))
+        # Extract objects from the event, unless every listener asked for
+        # the raw event
+        fields = self._event_dispatch.get(event_type)
+        if not any(listener[2] for listener in listeners):
+            event = msg_json
+        elif fields is None:
+            log.warning('Cannot find model "%s" for received event. '
+                        'Pass raw event.', event_type)
+            event = msg_json
+        else:
+            event = dict(msg_json)
+            get = msg_json.get
+            get_factory = CLASS_MAP.get
+            for field, type_ in fields:
+                factory = get_factory(type_)
+                if factory is None:
+                    continue
+                value = get(field)
+                if value is not None:
+                    event[field] = factory(self, value)
+
+        # Set a result of pending futures. Listeners registered while the
+        # futures are resolved are appended after the handled ones and kept.
+        handled = len(listeners)
+        survivors = []
+        for listener in islice(listeners, handled):
+            future, event_filter, needs_objects = listener
+            if future.done():
+                continue
+
+            result = event if needs_objects else msg_json
+            if event_filter is None or event_filter(result):
+                future.set_result(result)
+            else:
+                survivors.append(listener)
+        listeners[:handled] = survivors
+
     @coroutine
     def __run(self, ws):
         """Receives message from a WebSocket, sends them to the client's
         listeners.
+
+        Messages which are already buffered by the WebSocket are drained
+        and dispatched as a batch, so a burst of events does not cost a
+        coroutine round-trip per event.
         """
-        while True:
-            msg_str = yield ws.read_message()
+        read_message = ws.read_message
+        process_event = self.__process_event
+        loads = json_loads
+        read_future = None
+        closed = False
+        while not closed:
+            if read_future is None:
+                read_future = read_message()
+            msg_str = yield read_future
+            read_future = None
             if msg_str is None:
                 break
-            try:
-                msg_json = json.loads(msg_str)
-            except (TypeError, ValueError):
-                log.error('Invalid event: {0}'.format(msg_str))
-                continue
-            if not isinstance(msg_json, dict) or 'type' not in msg_json:
-                log.error('Invalid event: {0}'.format(msg_str))
-                continue
 
-            log.debug('Process ARI event: {0}'.format(msg_json))
-            event_type = msg_json['type']
-            listeners = self.event_listeners.get(event_type)
-            if listeners:
-                log.debug('Listeners of event type "{0}": {1}'
-                          .format(event_type, len(listeners)))
-                # Extract objects from the event
-                event_model = self.event_models.get(event_type)
-                if not event_model:
-                    log.warning('Cannot find model "{0}" for received event. '
-                                'Pass raw event.'.format(event_type))
-                    event = msg_json
-                else:
-                    event = dict()
-                    properties = event_model['properties']
-                    for field, value in msg_json.items():
-                        if field in properties:
-                            type_ = properties[field]['type']
-                            if type_ in CLASS_MAP:
-                                value = CLASS_MAP[type_](self, value)
-                        event[field] = value
-
-                # Set a result of pending futures
-                for listener in listeners:
-                    future, event_filter = listener
-                    if future.done():
-                        listeners.remove(listener)
-                        continue
-
-                    if event_filter is None or event_filter(event):
-                            future.set_result(event)
-                            listeners.remove(listener)
+            batch = [msg_str]
+            while len(batch) < EVENT_BATCH_SIZE:
+                read_future = read_message()
+                if not read_future.done():
+                    break
+                msg_str = read_future.result()
+                read_future = None
+                if msg_str is None:
+                    closed = True
+                    break
+                batch.append(msg_str)
+
+            for msg_str in batch:
+                try:
+                    msg_json = loads(msg_str)
+                    event_type = msg_json['type']
+                except (KeyError, TypeError, ValueError):
+                    log.error('Invalid event: %s', msg_str)
+                    continue
+                process_event(event_type, msg_json)
 
     @coroutine
     def run(self, apps):
@@ -149,16 +221,21 @@ class Client(object):
         self.websockets.add(ws)
         yield self.__run(ws)
 
-    def on_event(self, event_type, event_filter=None):
+    def on_event(self, event_type, event_filter=None, needs_objects=True):
         """Register listener for events with given type.
 
         :param event_type: String name of the event to register for.
         :param event_filter: Function to filter event objects.
         :type  event_filter: (dict) -> bool
+        :param needs_objects: If False, the filter and the future receive the
+                              raw event JSON; first class objects are only
+                              extracted when some listener needs them.
+        :type  needs_objects: bool
         :rtype: tornado.concurrent.Future
         """
         if event_type not in self.event_models:
             raise ValueError('Cannot find event model "{0}"'.format(event_type))
-        future = TracebackFuture()
-        self.event_listeners[event_type].append((future, event_filter))
+        future = Future()
+        self.event_listeners[event_type].append(
+            (future, event_filter, needs_objects))
         return future
@@ -17,13 +17,25 @@ The first-class objects also have 'on_event' methods, which can subscribe to
 Stasis events relating to that object.
 """
 
-import re
-import json
-from tornado.gen import coroutine, Return
+import sys
+from functools import partial
+from tornado.concurrent import (Future, future_add_done_callback,
+                                future_set_exc_info,
+                                future_set_result_unless_cancelled)
 from tornado.log import app_log as log
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 __all__ = []
 
+_MISSING = object()
+
+#: Parsed (class name, is_list) by Swagger response class.
+_RESPONSE_CLASSES = {}
+
 
 class Repository(object):
     """ARI repository.
@@ -40,10 +52,13 @@ class Repository(object):
     :type  resource:    swaggerpy.client.Resource
     """
 
+    __slots__ = ('client', 'name', 'api', '_method_cache')
+
     def __init__(self, client, name, resource):
         self.client = client
         self.name = name
         self.api = resource
+        self._method_cache = {}
 
     def __repr__(self):
         return 'Repository({0})'.format(self.name)
@@ -53,17 +68,22 @@ class Repository(object):
 
         :param item: Item name.
         """
+        method = self._method_cache.get(item)
+        if method is not None:
+            return method
+
         oper = getattr(self.api, item, None)
-        if not (hasattr(oper, '__call__') and hasattr(oper, 'json')):
+        oper_json = getattr(oper, 'json', _MISSING)
+        if oper_json is _MISSING or not callable(oper):
             raise AttributeError(
                 '"{0}" object has no attribute "{1}"'.format(self, item))
 
         # The returned function wraps the underlying operation, promoting the
         # received HTTP response to a first class object.
-        @coroutine
         def _promote(**kwargs):
-            resp = yield oper(**kwargs)
-            raise Return(promote(self.client, resp, oper.json))
+            return promote_future(self.client, oper, kwargs, oper_json)
+
+        self._method_cache[item] = _promote
         return _promote
 
 
@@ -72,6 +92,8 @@ class ObjectIdGenerator(object):
     representation.
     """
 
+    __slots__ = ()
+
     def get_params(self, obj_json):
         """Gets the paramater values for specifying this object in a query.
 
@@ -82,6 +104,17 @@ class ObjectIdGenerator(object):
         """
         raise NotImplementedError("Not implemented")
 
+    def apply_params(self, obj_json, params):
+        """Adds the paramater values for specifying this object in a query
+        to the given parameters.
+
+        :param obj_json: Instance data.
+        :type  obj_json: dict
+        :param params: Query parameters, updated in place.
+        :type  params: dict
+        """
+        params.update(self.get_params(obj_json))
+
     def id_as_str(self, obj_json):
         """Gets a single string identifying an object.
 
@@ -100,6 +133,8 @@ class DefaultObjectIdGenerator(ObjectIdGenerator):
     :param id_field:    Name of the field to specify in JSON.
     """
 
+    __slots__ = ('param_name', 'id_field')
+
     def __init__(self, param_name, id_field='id'):
         self.param_name = param_name
         self.id_field = id_field
@@ -107,10 +142,57 @@ class DefaultObjectIdGenerator(ObjectIdGenerator):
     def get_params(self, obj_json):
         return {self.param_name: obj_json[self.id_field]}
 
+    def apply_params(self, obj_json, params):
+        params[self.param_name] = obj_json[self.id_field]
+
     def id_as_str(self, obj_json):
         return obj_json[self.id_field]
 
 
+class ObjectOperation(object):
+    """Descriptor mapping a resource operation to a method of first class
+    objects.
+
+    The operation is looked up on each instance's own resource, so objects
+    of different clients share the descriptor, and objects whose resource
+    lacks the operation still have no such attribute.
+
+    :param name: Operation nickname.
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        oper = getattr(obj.api, self.name, None)
+        if getattr(oper, 'json', _MISSING) is _MISSING or not callable(oper):
+            raise AttributeError(
+                '"{0}" object has no attribute "{1}"'.format(obj, self.name))
+
+        def enrich_operation(**kwargs):
+            """Enriches an operation by specifying parameters specifying this
+            object's id (i.e., channelId=self.id), and promotes HTTP response
+            to a first-class object.
+
+            :param kwargs: Operation parameters
+            :return: First class object mapped from HTTP response.
+            """
+            try:
+                oper_json = oper.json
+                # Add id to param list
+                obj.id_generator.apply_params(obj.json, kwargs)
+            except Exception:
+                return _failed_future()
+            return promote_future(obj.client, oper, kwargs, oper_json)
+
+        enrich_operation.__name__ = self.name
+        return enrich_operation
+
+
 class BaseObject(object):
     """Base class for ARI domain objects.
 
@@ -131,34 +213,25 @@ class BaseObject(object):
         self.id = self.id_generator.id_as_str(as_json)
 
     def __repr__(self):
-        return '{0}({1})'.format(self.__class__.__name__, self.id)
+        return '{0}({1})'.format(type(self).__name__, self.id)
 
     def __getattr__(self, item):
         """Promote resource operations related to a single resource to methods
         on this class.
 
+        The operation is bound to the class on first lookup, so later lookups
+        on any instance skip this method. See ObjectOperation.
+
         :param item:
         """
         oper = getattr(self.api, item, None)
-        if not (hasattr(oper, '__call__') and hasattr(oper, 'json')):
+        oper_json = getattr(oper, 'json', _MISSING)
+        if oper_json is _MISSING or not callable(oper):
             raise AttributeError(
                 '"{0}" object has no attribute "{1}"'.format(self, item))
 
-        @coroutine
-        def enrich_operation(**kwargs):
-            """Enriches an operation by specifying parameters specifying this
-            object's id (i.e., channelId=self.id), and promotes HTTP response
-            to a first-class object.
-
-            :param kwargs: Operation parameters
-            :return: First class object mapped from HTTP response.
-            """
-            # Add id to param list
-            kwargs.update(self.id_generator.get_params(self.json))
-            resp = yield oper(**kwargs)
-            raise Return(promote(self.client, resp, oper.json))
-
-        return enrich_operation
+        setattr(type(self), item, ObjectOperation(item))
+        return getattr(self, item)
 
     def on_event(self, event_type):
         """Register event listeners for this specific domain object.
@@ -168,13 +241,24 @@ class BaseObject(object):
         :rtype: tornado.concurrent.Future
         """
 
-        def event_filter(event):
+        # Only fields whose objects are instances of this object's class
+        # can refer to it
+        cls = type(self)
+        model = self.client.event_models.get(event_type, {})
+        fields = []
+        for field, prop in model.get('properties', {}).items():
+            factory = CLASS_MAP.get(prop['type'])
+            if factory is not None and issubclass(factory, cls):
+                fields.append(field)
+
+        def event_filter(event, _fields=tuple(fields), _cls=cls, _id=self.id):
             """Filter received events for this object.
 
             :param event: Event.
             """
-            for c in event.values():
-                if isinstance(c, self.__class__) and c.id == self.id:
+            for field in _fields:
+                c = event.get(field)
+                if isinstance(c, _cls) and c.id == _id:
                     return True
             return False
 
@@ -258,14 +342,20 @@ class EndpointIdGenerator(ObjectIdGenerator):
     """Id generator for endpoints, because they are weird.
     """
 
+    __slots__ = ()
+
     def get_params(self, obj_json):
         return {
             'tech': obj_json['technology'],
             'resource': obj_json['resource']
         }
 
+    def apply_params(self, obj_json, params):
+        params['tech'] = obj_json['technology']
+        params['resource'] = obj_json['resource']
+
     def id_as_str(self, obj_json):
-        return '{tech}/{resource}'.format(**self.get_params(obj_json))
+        return obj_json['technology'] + '/' + obj_json['resource']
 
 
 class Endpoint(BaseObject):
@@ -326,6 +416,27 @@ class Mailbox(BaseObject):
             client, client.swagger.mailboxes, mailbox_json)
 
 
+def _resolve_response(response_class):
+    """Resolve a Swagger response class to a first class object factory.
+
+    :param response_class: Response class of a Swagger operation.
+    :type  response_class: str
+    :return: Factory (or None), whether the response is a list, and the
+             class name.
+    :rtype:  tuple
+    """
+    entry = _RESPONSE_CLASSES.get(response_class)
+    if entry is None:
+        name = response_class
+        is_list = name.startswith('List[') and name.endswith(']')
+        if is_list:
+            name = name[5:-1]
+        entry = _RESPONSE_CLASSES[response_class] = (name, is_list)
+    name, is_list = entry
+    # CLASS_MAP is public and may be changed at runtime; never cache it
+    return CLASS_MAP.get(name), is_list, name
+
+
 def promote(client, resp, operation_json):
     """Promote a response from the request's HTTP response to a first class
      object.
@@ -339,23 +450,65 @@ def promote(client, resp, operation_json):
     :return:
     """
     resp.rethrow()
-
-    response_class = operation_json['responseClass']
-    is_list = False
-    m = re.match('''List\[(.*)\]''', response_class)
-    if m:
-        response_class = m.group(1)
-        is_list = True
-    factory = CLASS_MAP.get(response_class)
-    if factory:
-        resp_json = json.loads(resp.body)
-        if is_list:
-            return [factory(client, obj) for obj in resp_json]
-        return factory(client, resp_json)
     if resp.code == 204:
         return None
-    log.info('No mapping for {0}; returning JSON'.format(response_class))
-    return json.loads(resp.body)
+
+    factory, is_list, response_class = _resolve_response(
+        operation_json['responseClass'])
+    resp_json = json_loads(resp.body)
+    if factory is None:
+        log.info('No mapping for %s; returning JSON', response_class)
+        return resp_json
+    if is_list:
+        return list(map(partial(factory, client), resp_json))
+    return factory(client, resp_json)
+
+
+def _failed_future():
+    """Create a future failed with the exception currently being handled.
+
+    :rtype: tornado.concurrent.Future
+    """
+    future = Future()
+    future_set_exc_info(future, sys.exc_info())
+    return future
+
+
+def promote_future(client, operation, params, operation_json):
+    """Call an operation and promote its response once it is received.
+
+    Errors raised by the call itself are reported through the returned
+    future, as they would be from a coroutine.
+
+    :param client:  ARI client.
+    :type  client:  client.Client
+    :param operation: Swagger operation.
+    :param params:  Operation parameters.
+    :type  params:  dict
+    :param operation_json: JSON model from Swagger API.
+    :type  operation_json: dict
+    :return: Future resolved with the result of promote().
+    :rtype:  tornado.concurrent.Future
+    """
+    try:
+        future = operation(**params)
+    except Exception:
+        return _failed_future()
+
+    result = Future()
+
+    def on_response(response_future):
+        try:
+            promoted = promote(client, response_future.result(),
+                               operation_json)
+        except Exception:
+            if not result.cancelled():
+                future_set_exc_info(result, sys.exc_info())
+        else:
+            future_set_result_unless_cancelled(result, promoted)
+
+    future_add_done_callback(future, on_response)
+    return result
 
 
 CLASS_MAP = {
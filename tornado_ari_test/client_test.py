@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+
+import json
+import unittest
+
+import tornado_swagger.client
+from tornado.concurrent import Future
+from tornado.ioloop import IOLoop
+from tornado.testing import AsyncTestCase, gen_test
+
+import tornado_ari
+from tornado_ari.model import CLASS_MAP, Channel
+
+EVENT_MODELS = {
+    'ChannelStateChange': {
+        'properties': {
+            'type': {'type': 'string'},
+            'channel': {'type': 'Channel'},
+        },
+    },
+    'Dial': {
+        'properties': {
+            'type': {'type': 'string'},
+            'caller': {'type': 'Channel'},
+            'peer': {'type': 'Channel'},
+            'dialstatus': {'type': 'string'},
+        },
+    },
+}
+
+
+def done_future(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+class FakeWebSocket(object):
+    """WebSocket with all of its messages already buffered.
+    """
+
+    def __init__(self, messages):
+        self.messages = [json.dumps(msg) for msg in messages]
+
+    def read_message(self):
+        return done_future(self.messages.pop(0) if self.messages else None)
+
+    def close(self):
+        pass
+
+
+class SlowWebSocket(FakeWebSocket):
+    """WebSocket where every third message arrives on a later IOLoop
+    iteration.
+    """
+
+    def __init__(self, messages):
+        super(SlowWebSocket, self).__init__(messages)
+        self.reads = 0
+
+    def read_message(self):
+        self.reads += 1
+        if self.reads % 3:
+            return super(SlowWebSocket, self).read_message()
+        future = Future()
+        IOLoop.current().add_callback(
+            future.set_result,
+            self.messages.pop(0) if self.messages else None)
+        return future
+
+
+class FakeEvents(object):
+    def __init__(self):
+        self.messages = []
+        self.websocket_class = FakeWebSocket
+
+    def eventWebsocket(self, app):
+        return done_future(self.websocket_class(self.messages))
+
+
+class FakeSwaggerClient(object):
+    def __init__(self, url, io_loop=None, http_client=None):
+        self.resources = {}
+        self.api_docs = {'apis': [{
+            'name': 'events',
+            'api_declaration': {'models': EVENT_MODELS},
+        }]}
+        self.events = FakeEvents()
+        self.channels = object()
+
+    def close(self):
+        pass
+
+
+class ClientTest(AsyncTestCase):
+    def setUp(self):
+        super(ClientTest, self).setUp()
+        self.swagger_client = tornado_swagger.client.SwaggerClient
+        tornado_swagger.client.SwaggerClient = FakeSwaggerClient
+        self.uut = tornado_ari.Client('http://ari.py/', io_loop=self.io_loop)
+
+    def tearDown(self):
+        tornado_swagger.client.SwaggerClient = self.swagger_client
+        super(ClientTest, self).tearDown()
+
+    def feed(self, *messages):
+        self.uut.swagger.events.messages.extend(messages)
+        return self.uut.run('test')
+
+    @gen_test
+    def test_listeners_resolved_in_order(self):
+        first = self.uut.on_event('Dial')
+        second = self.uut.on_event('Dial', lambda e: e['dialstatus'] == '')
+        third = self.uut.on_event(
+            'Dial', lambda e: e['dialstatus'] == 'ANSWER')
+        yield self.feed({'type': 'Dial', 'dialstatus': ''})
+
+        self.assertEqual('', first.result()['dialstatus'])
+        self.assertEqual('', second.result()['dialstatus'])
+        self.assertFalse(third.done())
+        self.assertEqual([third],
+                         [l[0] for l in self.uut.event_listeners['Dial']])
+
+        yield self.feed({'type': 'Dial', 'dialstatus': 'ANSWER'})
+        self.assertEqual('ANSWER', third.result()['dialstatus'])
+        self.assertEqual([], self.uut.event_listeners['Dial'])
+
+    @gen_test
+    def test_pending_reads_keep_order(self):
+        received = []
+
+        def record(event):
+            received.append(event['dialstatus'])
+            return False
+
+        self.uut.on_event('Dial', record, needs_objects=False)
+        self.uut.swagger.events.websocket_class = SlowWebSocket
+        yield self.feed(*[{'type': 'Dial', 'dialstatus': str(i)}
+                          for i in range(200)])
+
+        self.assertEqual([str(i) for i in range(200)], received)
+
+    @gen_test
+    def test_failing_filter_keeps_listeners(self):
+        def broken_filter(event):
+            raise RuntimeError('broken')
+
+        first = self.uut.on_event('Dial', broken_filter)
+        second = self.uut.on_event('Dial')
+        with self.assertRaises(RuntimeError):
+            yield self.feed({'type': 'Dial', 'dialstatus': ''})
+
+        self.assertFalse(second.done())
+        self.assertEqual([first, second],
+                         [l[0] for l in self.uut.event_listeners['Dial']])
+
+    @gen_test
+    def test_raw_listener(self):
+        raw = self.uut.on_event('ChannelStateChange', needs_objects=False)
+        yield self.feed({'type': 'ChannelStateChange',
+                         'channel': {'id': 'c1'}})
+
+        self.assertEqual({'id': 'c1'}, raw.result()['channel'])
+
+    @gen_test
+    def test_mixed_listeners(self):
+        raw = self.uut.on_event(
+            'ChannelStateChange',
+            lambda e: isinstance(e['channel'], dict), needs_objects=False)
+        objects = self.uut.on_event(
+            'ChannelStateChange', lambda e: isinstance(e['channel'], Channel))
+        yield self.feed({'type': 'ChannelStateChange',
+                         'channel': {'id': 'c1'}})
+
+        self.assertEqual({'id': 'c1'}, raw.result()['channel'])
+        self.assertIsInstance(objects.result()['channel'], Channel)
+        self.assertEqual('c1', objects.result()['channel'].id)
+
+    @gen_test
+    def test_class_map_changed_after_construction(self):
+        class MyChannel(Channel):
+            pass
+
+        listener = self.uut.on_event('ChannelStateChange')
+        CLASS_MAP['Channel'] = MyChannel
+        try:
+            yield self.feed({'type': 'ChannelStateChange',
+                             'channel': {'id': 'c1'}})
+        finally:
+            CLASS_MAP['Channel'] = Channel
+
+        self.assertIsInstance(listener.result()['channel'], MyChannel)
+
+    @gen_test
+    def test_object_listener(self):
+        channel = Channel(self.uut, {'id': 'c1'})
+        listener = channel.on_event('Dial')
+        yield self.feed({'type': 'Dial', 'caller': {'id': 'c0'}},
+                        {'type': 'Dial', 'caller': {'id': 'c0'},
+                         'peer': {'id': 'c1'}})
+
+        self.assertEqual('c1', listener.result()['peer'].id)
+
+    @gen_test
+    def test_object_listener_with_mapped_subclass(self):
+        class MyChannel(Channel):
+            pass
+
+        CLASS_MAP['Channel'] = MyChannel
+        try:
+            listener = Channel(self.uut, {'id': 'c1'}).on_event(
+                'ChannelStateChange')
+            yield self.feed({'type': 'ChannelStateChange',
+                             'channel': {'id': 'c1'}})
+        finally:
+            CLASS_MAP['Channel'] = Channel
+
+        self.assertIsInstance(listener.result()['channel'], MyChannel)
+
+    @gen_test
+    def test_objects_keep_event_snapshot(self):
+        ringing = self.uut.on_event('ChannelStateChange')
+        up = self.uut.on_event(
+            'ChannelStateChange', lambda e: e['channel'].json['state'] == 'Up')
+        yield self.feed(
+            {'type': 'ChannelStateChange',
+             'channel': {'id': 'c1', 'state': 'Ring'}},
+            {'type': 'ChannelStateChange',
+             'channel': {'id': 'c1', 'state': 'Up'}})
+
+        self.assertEqual('Ring', ringing.result()['channel'].json['state'])
+        self.assertEqual('Up', up.result()['channel'].json['state'])
+
+
+if __name__ == '__main__':
+    unittest.main()
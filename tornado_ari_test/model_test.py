@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+import unittest
+
+from tornado.concurrent import Future
+from tornado.testing import AsyncTestCase, gen_test
+
+from tornado_ari.model import Channel, DefaultObjectIdGenerator, Repository
+
+
+class FakeResponse(object):
+    code = 200
+    body = b'{"id": "c1"}'
+
+    def rethrow(self):
+        pass
+
+
+class FakeOperation(object):
+    json = {'responseClass': 'Channel'}
+
+    def __init__(self):
+        self.future = Future()
+
+    def __call__(self, channelId=None):
+        return self.future
+
+
+class FakeResource(object):
+    def __init__(self):
+        self.get = FakeOperation()
+
+
+class FakeSwaggerClient(object):
+    def __init__(self):
+        self.channels = FakeResource()
+
+
+class FakeClient(object):
+    def __init__(self):
+        self.swagger = FakeSwaggerClient()
+
+
+class ModelTest(AsyncTestCase):
+    def setUp(self):
+        super(ModelTest, self).setUp()
+        self.client = FakeClient()
+        self.repo = Repository(self.client, 'channels',
+                               self.client.swagger.channels)
+
+    @gen_test
+    def test_promote_response(self):
+        future = self.repo.get(channelId='c1')
+        self.client.swagger.channels.get.future.set_result(FakeResponse())
+        channel = yield future
+
+        self.assertIsInstance(channel, Channel)
+        self.assertEqual('c1', channel.id)
+
+    @gen_test
+    def test_invalid_parameters_fail_future(self):
+        future = self.repo.get(bad=1)
+
+        self.assertTrue(future.done())
+        with self.assertRaises(TypeError):
+            yield future
+
+    @gen_test
+    def test_missing_id_fails_future(self):
+        channel = Channel(self.client, {'id': 'c1'})
+        del channel.json['id']
+        future = channel.get()
+
+        self.assertTrue(future.done())
+        with self.assertRaises(KeyError):
+            yield future
+
+    @gen_test
+    def test_object_operation(self):
+        future = Channel(self.client, {'id': 'c1'}).get()
+        self.client.swagger.channels.get.future.set_result(FakeResponse())
+        channel = yield future
+
+        self.assertEqual('c1', channel.id)
+
+    def test_object_operation_missing_on_resource(self):
+        Channel(self.client, {'id': 'c1'}).get
+        other = FakeClient()
+        del other.swagger.channels.get
+        channel = Channel(other, {'id': 'c2'})
+
+        self.assertFalse(hasattr(channel, 'get'))
+        with self.assertRaises(AttributeError):
+            channel.get
+
+    def test_cancelled_future(self):
+        future = self.repo.get(channelId='c1')
+        future.cancel()
+        self.client.swagger.channels.get.future.set_result(FakeResponse())
+        self.io_loop.add_callback(self.stop)
+        self.wait()
+
+        self.assertTrue(future.cancelled())
+
+
+class IdGeneratorTest(unittest.TestCase):
+    def test_default_id(self):
+        gen = DefaultObjectIdGenerator('channelId')
+
+        self.assertEqual('1', gen.id_as_str({'id': '1'}))
+        self.assertEqual('1', DefaultObjectIdGenerator.id_as_str(
+            gen, {'id': '1'}))
+
+    def test_overridden_id(self):
+        class PrefixIdGenerator(DefaultObjectIdGenerator):
+            def id_as_str(self, obj_json):
+                return 'x-' + obj_json[self.id_field]
+
+        gen = PrefixIdGenerator('channelId')
+        self.assertEqual('x-1', gen.id_as_str({'id': '1'}))
+
+
+if __name__ == '__main__':
+    unittest.main()